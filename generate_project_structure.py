@@ -4,12 +4,13 @@ Script to generate the PDF Image Extractor project structure.
 Run this from the directory where you want to create the project.
 """
 
+import io
 import os
 import sys
 
-# Dictionary of files to create with their contents
+# Dictionary of files to create with their contents (bytes, written as-is)
 files = {
-    'setup.py': '''from setuptools import setup, find_packages
+    'setup.py': b'''from setuptools import setup, find_packages
 
 setup(
     name="pdfimages",
@@ -46,7 +47,7 @@ setup(
     ],
 )''',
 
-    'README.md': '''# PDF Image Extractor
+    'README.md': b'''# PDF Image Extractor
 
 A command-line utility to extract all distinct images from PDF files for content reuse purposes. The utility supports batch processing of multiple PDFs and maintains the directory structure in the output.
 
@@ -109,7 +110,7 @@ pdfimages [options] <input_path> [<output_path>]
 
 [MIT License](LICENSE)''',
 
-    '.gitignore': '''# Byte-compiled / optimized / DLL files
+    '.gitignore': b'''# Byte-compiled / optimized / DLL files
 __pycache__/
 *.py[cod]
 *$py.class
@@ -255,14 +256,14 @@ cython_debug/
 # Project specific
 extracted_images/''',
 
-    'pdfimages/__init__.py': '''"""
+    'pdfimages/__init__.py': b'''"""
 PDF Image Extractor - A command-line utility to extract images from PDF files
 """
 
 __version__ = '0.1.0'
 ''',
 
-    'pdfimages/__main__.py': '''#!/usr/bin/env python
+    'pdfimages/__main__.py': b'''#!/usr/bin/env python
 """
 PDF Image Extractor
 
@@ -281,22 +282,22 @@ if __name__ == "__main__":
     main()
 ''',
 
-    'pdfimages/cli/__init__.py': '''"""
+    'pdfimages/cli/__init__.py': b'''"""
 Command-line interface for PDF Image Extractor
 """
 ''',
 
-    'pdfimages/core/__init__.py': '''"""
+    'pdfimages/core/__init__.py': b'''"""
 Core functionality for PDF Image Extractor
 """
 ''',
 
-    'pdfimages/utils/__init__.py': '''"""
+    'pdfimages/utils/__init__.py': b'''"""
 Utility functions for PDF Image Extractor
 """
 ''',
 
-    'tests/__init__.py': '''"""
+    'tests/__init__.py': b'''"""
 Tests for PDF Image Extractor
 """
 ''',
@@ -333,36 +334,41 @@ empty_files = [
 
 def create_directories():
     """Create the project directory structure"""
-    directories = [
-        'pdfimages',
-        'pdfimages/cli',
-        'pdfimages/core',
-        'pdfimages/utils',
-        'tests'
-    ]
+    # Every directory needed by the scaffolded files, including ancestors
+    # that hold no files themselves, created once each
+    directories = set()
+    for filepath in list(files) + empty_files:
+        directory = os.path.dirname(filepath)
+        while directory and directory not in directories:
+            directories.add(directory)
+            directory = os.path.dirname(directory)
     
-    for directory in directories:
-        os.makedirs(directory, exist_ok=True)
+    # Shallowest first so each parent exists before its children
+    for directory in sorted(directories, key=lambda d: (d.count('/'), d)):
+        try:
+            os.mkdir(directory)
+        except FileExistsError:
+            pass
         print(f"Created directory: {directory}")
 
 def create_files():
     """Create files with content"""
-    for filepath, content in files.items():
-        with open(filepath, 'w') as f:
-            f.write(content)
-        print(f"Created file: {filepath}")
-    
+    # Payloads are already bytes, so each file is a single unbuffered write
+    entries = [(filepath, content, "Created file") for filepath, content in files.items()]
     for filepath in empty_files:
-        directory = os.path.dirname(filepath)
-        if not os.path.exists(directory):
-            os.makedirs(directory, exist_ok=True)
-            
-        with open(filepath, 'w') as f:
-            if filepath.endswith('.py'):
-                f.write('"""To be implemented"""\n')
-            else:
-                f.write('')
-        print(f"Created empty file: {filepath}")
+        content = b'"""To be implemented"""\n' if filepath.endswith('.py') else b''
+        entries.append((filepath, content, "Created empty file"))
+    
+    # Group writes by directory (stable sort keeps the original order within each)
+    entries.sort(key=lambda entry: os.path.dirname(entry[0]))
+    
+    log = io.StringIO()
+    for filepath, payload, label in entries:
+        with open(filepath, 'wb', buffering=0) as f:
+            f.write(payload)
+        log.write(f"{label}: {filepath}\n")
+    
+    sys.stdout.write(log.getvalue())
 
 def main():
     """Main function to generate the project structure"""
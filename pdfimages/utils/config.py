@@ -5,10 +5,162 @@ This module provides functionality to load, validate, and merge configuration
 settings from various sources including YAML files and command-line arguments.
 """
 
+import copy
+import functools
 import os
+import sys
 import yaml
+from collections import OrderedDict
+from collections.abc import Mapping
 from pathlib import Path
-from typing import Dict, Any, Optional, Union, List
+from types import MappingProxyType
+from typing import Dict, Any, Optional, Union, List, Tuple
+
+try:
+    # libyaml-backed loader, used when PyYAML was built with it
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
+
+# Location of the configuration file shipped with the package
+_PACKAGE_DEFAULT_CONFIG = Path(__file__).parent.parent / "default_config.yaml"
+
+# Interns dot-notation keys. Equal keys then share one string object, so a
+# dict or set probe that finds a matching hash confirms the key by identity
+# instead of comparing characters (the hash itself is still computed).
+_K = sys.intern
+
+_VALID_FORMATS = ("png", "jpg", "jpeg", "tiff", "bmp")
+_VALID_LOG_LEVELS = ("DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL")
+_FORMAT_LOOKUP = frozenset(_VALID_FORMATS)
+_LOG_LEVEL_LOOKUP = frozenset(_VALID_LOG_LEVELS)
+
+
+# Parsed YAML files keyed by absolute path, as (st_mtime_ns, st_size, data)
+_YAML_CACHE: "OrderedDict[str, Tuple[int, int, Any]]" = OrderedDict()
+_YAML_CACHE_MAX = 100
+
+
+@functools.lru_cache(maxsize=512)
+def _split_key(key: str) -> Tuple[str, ...]:
+    """Split a dot-notation key into its parts, caching the result."""
+    return tuple(key.split('.'))
+
+
+def _cached_yaml_load(config_file: Union[str, Path]) -> Any:
+    """
+    Parse a YAML file, reusing the previous result while the file is unchanged.
+    
+    Args:
+        config_file: Path to the YAML file
+        
+    Returns:
+        A fresh copy of the parsed data, safe for the caller to mutate
+        
+    Raises:
+        OSError: If the file cannot be read
+        yaml.YAMLError: If the file cannot be parsed
+    """
+    key = os.path.abspath(config_file)
+    stat = os.stat(key)
+    entry = _YAML_CACHE.get(key)
+    if entry is not None and entry[0] == stat.st_mtime_ns and entry[1] == stat.st_size:
+        _YAML_CACHE.move_to_end(key)
+        return copy.deepcopy(entry[2])
+    
+    # Read the whole file as bytes and let the loader detect the encoding
+    fd = os.open(key, os.O_RDONLY)
+    try:
+        stat = os.fstat(fd)
+        chunks = []
+        while True:
+            chunk = os.read(fd, max(stat.st_size, 65536))
+            if not chunk:
+                break
+            chunks.append(chunk)
+    finally:
+        os.close(fd)
+    data = yaml.load(b''.join(chunks), Loader=_YamlLoader)
+    
+    _YAML_CACHE[key] = (stat.st_mtime_ns, stat.st_size, data)
+    _YAML_CACHE.move_to_end(key)
+    if len(_YAML_CACHE) > _YAML_CACHE_MAX:
+        _YAML_CACHE.popitem(last=False)
+    return copy.deepcopy(data)
+
+
+def _check_key(key: Any) -> None:
+    """
+    Reject keys that could not be addressed with dot notation.
+    
+    Raises:
+        ConfigurationError: If key is not a string or contains a dot
+    """
+    if not isinstance(key, str) or '.' in key:
+        raise ConfigurationError(f"Configuration keys must be strings without dots, found: {key!r}")
+
+
+def _join_key(prefix: str, key: str) -> str:
+    """Build the dot-notation key for key within prefix, interned with _K."""
+    return _K(f"{prefix}.{key}" if prefix else key)
+
+
+def _flatten(source: Dict[str, Any], prefix: str = "") -> Dict[str, Any]:
+    """
+    Map every key under a nested dictionary to its dot-notation path.
+    
+    Args:
+        source: Dictionary to flatten
+        prefix: Dot-notation path of source, or "" for the root
+        
+    Returns:
+        Dictionary of dot-notation path to value, including nested sections
+    """
+    flat = {}
+    stack = [(prefix, source)]
+    while stack:
+        prefix, node = stack.pop()
+        # Same keys as _join_key, inlined since this runs for every entry
+        dotted = prefix + "." if prefix else ""
+        for key, value in node.items():
+            path = _K(f"{dotted}{key}")
+            flat[path] = value
+            if isinstance(value, Mapping):
+                stack.append((path, value))
+    return flat
+
+
+def _freeze(source: Dict[str, Any]) -> Mapping:
+    """Return a read-only view of a nested dictionary."""
+    return MappingProxyType({
+        key: _freeze(value) if isinstance(value, dict) else value
+        for key, value in source.items()
+    })
+
+
+def _thaw(source: Mapping) -> Dict[str, Any]:
+    """
+    Return a plain-dict deep copy of a nested mapping, such as a read-only view.
+    
+    Raises:
+        ConfigurationError: If any key could not be addressed with dot notation
+    """
+    thawed = {}
+    for key, value in source.items():
+        _check_key(key)
+        thawed[key] = _thaw(value) if isinstance(value, Mapping) else copy.deepcopy(value)
+    return thawed
+
+
+def _is_number(value: Any) -> bool:
+    """Return True if value is an int or float."""
+    return isinstance(value, (int, float))
+
+
+def _is_optional_number(value: Any) -> bool:
+    """Return True if value is None or a number."""
+    return value is None or _is_number(value)
 
 
 class ConfigurationError(Exception):
@@ -24,8 +176,10 @@ class Configuration:
     and validating configuration values.
     """
     
-    # Default configuration values
-    DEFAULT_CONFIG = {
+    __slots__ = ("_config", "_flat", "_dirty")
+    
+    # Default configuration values (instances start from a deep copy of this)
+    _DEFAULT_TEMPLATE = {
         "output": {
             "directory": "extracted_images",
             "maintain_structure": True,
@@ -56,6 +210,35 @@ class Configuration:
         }
     }
     
+    # Read-only view of the defaults, over a private copy so nothing in it
+    # (including its lists) is shared with the template instances start from
+    DEFAULT_CONFIG = _freeze(copy.deepcopy(_DEFAULT_TEMPLATE))
+    
+    # Validation rules as (key, predicate, message) applied in order by validate().
+    # Messages may reference the offending value as {value}.
+    _VALIDATORS = (
+        (_K("output.directory"), lambda v: isinstance(v, str), "Output directory must be a string"),
+        (_K("output.maintain_structure"), lambda v: isinstance(v, bool), "maintain_structure must be a boolean"),
+        (_K("output.format"), lambda v: isinstance(v, str), "Output format must be a string"),
+        (_K("output.format"), lambda v: v.lower() in _FORMAT_LOOKUP,
+         f"Output format must be one of: {', '.join(_VALID_FORMATS)}, instead found: {{value}}"),
+        (_K("processing.min_width"), _is_optional_number, "min_width must be a number"),
+        (_K("processing.min_height"), _is_optional_number, "min_height must be a number"),
+        (_K("processing.quality"), _is_optional_number, "quality must be a number"),
+        (_K("processing.max_width"), _is_optional_number, "max_width must be a number or None"),
+        (_K("processing.max_height"), _is_optional_number, "max_height must be a number or None"),
+        (_K("processing.quality"), lambda v: _is_number(v) and 0 <= v <= 100, "Quality must be between 0 and 100"),
+        (_K("processing.scaling"), lambda v: _is_number(v) and 0 < v <= 10,
+         "Scaling must be between 0 (exclusive) and 10"),
+        (_K("processing.deduplicate"), lambda v: isinstance(v, bool), "deduplicate must be a boolean"),
+        (_K("processing.similarity_threshold"), lambda v: _is_number(v) and 0 <= v <= 1,
+         "similarity_threshold must be between 0 and 1"),
+        (_K("filters.include_types"), lambda v: isinstance(v, list), "include_types must be a list"),
+        (_K("filters.exclude_types"), lambda v: isinstance(v, list), "exclude_types must be a list"),
+        (_K("logging.level"), lambda v: isinstance(v, str) and v in _LOG_LEVEL_LOOKUP,
+         f"Log level must be one of: {', '.join(_VALID_LOG_LEVELS)}"),
+    )
+    
     def __init__(self, config_dict: Optional[Dict[str, Any]] = None, config_file: Optional[Union[str, Path]] = None):
         """
         Initialize a Configuration object.
@@ -65,8 +248,10 @@ class Configuration:
             config_file: Optional path to a YAML configuration file
         """
         # Create a deep copy of the default config to avoid modifying the class variable
-        self.config = {}
-        self._deep_merge(self.config, self.DEFAULT_CONFIG)
+        self._config = copy.deepcopy(self._DEFAULT_TEMPLATE)
+        self._rebuild_flat()
+        # Keys changed since the last successful validate(); everything to start with
+        self._dirty = set(self._flat)
         
         if config_file:
             self.load_from_file(config_file)
@@ -87,90 +272,109 @@ class Configuration:
             ConfigurationError: If the file cannot be read or parsed
         """
         try:
-            with open(config_file, 'r') as f:
-                file_config = yaml.safe_load(f)
-                if file_config:
-                    self.merge_config(file_config)
+            file_config = _cached_yaml_load(config_file)
+            if file_config:
+                self.merge_config(file_config)
         except (yaml.YAMLError, OSError) as e:
             raise ConfigurationError(f"Failed to load configuration from {config_file}: {str(e)}")
     
+    def load_from_string(self, content: Union[str, bytes]) -> None:
+        """
+        Load configuration from a YAML document held in memory.
+        
+        Args:
+            content: The YAML document as text or bytes
+            
+        Raises:
+            ConfigurationError: If the content cannot be parsed or is not a mapping
+        """
+        try:
+            string_config = yaml.load(content, Loader=_YamlLoader)
+        except yaml.YAMLError as e:
+            raise ConfigurationError(f"Failed to parse configuration: {str(e)}")
+        
+        if string_config is None:
+            return
+        if not isinstance(string_config, dict):
+            raise ConfigurationError(
+                f"Configuration must be a mapping, found: {type(string_config).__name__}")
+        self.merge_config(string_config)
+    
     def merge_config(self, config_dict: Dict[str, Any]) -> None:
         """
         Merge provided configuration with current configuration.
         
         Args:
             config_dict: Dictionary with configuration values to merge
+            
+        Raises:
+            ConfigurationError: If a key is not a string or contains a dot
         """
-        self._deep_merge(self.config, config_dict)
+        stack = [("", self._config, config_dict)]
+        while stack:
+            prefix, target, source = stack.pop()
+            for key, value in source.items():
+                _check_key(key)
+                path = _join_key(prefix, key)
+                if isinstance(value, Mapping) and isinstance(target.get(key), dict):
+                    stack.append((path, target[key], value))
+                else:
+                    self._assign(target, key, path, value)
     
-    def _deep_merge(self, target: Dict[str, Any], source: Dict[str, Any]) -> None:
+    def _assign(self, target: Dict[str, Any], key: str, path: str, value: Any) -> None:
         """
-        Recursively merge source dictionary into target dictionary.
+        Store a value in a section and update the flat index to match.
         
         Args:
-            target: Target dictionary to merge into
-            source: Source dictionary to merge from
+            target: Section dictionary to store the value in
+            key: Key within the section
+            path: Dot-notation key of the value
+            value: The value to store
         """
-        for key, value in source.items():
-            if key in target and isinstance(target[key], dict) and isinstance(value, dict):
-                self._deep_merge(target[key], value)
-            else:
-                target[key] = value
+        # Store caller-supplied sections as plain dict copies, outside the caller's reach
+        if isinstance(value, Mapping):
+            value = _thaw(value)
+        
+        # Drop index entries for any subtree the key previously held
+        if isinstance(target.get(key), dict):
+            prefix = path + '.'
+            stale = [stale_path for stale_path in self._flat if stale_path.startswith(prefix)]
+            for stale_path in stale:
+                del self._flat[stale_path]
+            self._dirty.update(stale)
+        
+        target[key] = value
+        self._flat[path] = value
+        self._dirty.add(path)
+        if isinstance(value, dict):
+            subtree = _flatten(value, path)
+            self._flat.update(subtree)
+            self._dirty.update(subtree)
+    
+    def _rebuild_flat(self) -> None:
+        """Rebuild the dot-notation index over the whole configuration."""
+        self._flat = _flatten(self._config)
     
     def validate(self) -> None:
         """
         Validate the configuration values.
         
+        Only keys changed through set(), merge_config() or the load methods
+        since the last successful validation are re-checked.
+        
         Raises:
             ConfigurationError: If any configuration value is invalid
         """
-        # Validate output configuration
-        if not isinstance(self.config["output"]["directory"], str):
-            raise ConfigurationError("Output directory must be a string")
-        
-        if not isinstance(self.config["output"]["maintain_structure"], bool):
-            raise ConfigurationError("maintain_structure must be a boolean")
-        
-        valid_formats = ["png", "jpg", "jpeg", "tiff", "bmp"]
-        if not isinstance(self.config["output"]["format"], str):
-            raise ConfigurationError(f"Output format must be a string")
-        if self.config["output"]["format"].lower() not in valid_formats:
-            raise ConfigurationError(f"Output format must be one of: {', '.join(valid_formats)}, instead found: {self.config['output']['format']}")
-        
-        # Validate processing configuration
-        for param in ["min_width", "min_height", "quality"]:
-            if (self.config["processing"][param] is not None and 
-                not isinstance(self.config["processing"][param], (int, float))):
-                raise ConfigurationError(f"{param} must be a number")
+        flat = self._flat
+        dirty = self._dirty
+        for key, is_valid, message in self._VALIDATORS:
+            if key not in dirty:
+                continue
+            value = flat.get(key)
+            if not is_valid(value):
+                raise ConfigurationError(message.format(value=value))
         
-        for param in ["max_width", "max_height"]:
-            if (self.config["processing"][param] is not None and 
-                not isinstance(self.config["processing"][param], (int, float))):
-                raise ConfigurationError(f"{param} must be a number or None")
-        
-        if not 0 <= self.config["processing"]["quality"] <= 100:
-            raise ConfigurationError("Quality must be between 0 and 100")
-        
-        if not 0 < self.config["processing"]["scaling"] <= 10:
-            raise ConfigurationError("Scaling must be between 0 (exclusive) and 10")
-        
-        if not isinstance(self.config["processing"]["deduplicate"], bool):
-            raise ConfigurationError("deduplicate must be a boolean")
-        
-        if not 0 <= self.config["processing"]["similarity_threshold"] <= 1:
-            raise ConfigurationError("similarity_threshold must be between 0 and 1")
-        
-        # Validate filters configuration
-        if not isinstance(self.config["filters"]["include_types"], list):
-            raise ConfigurationError("include_types must be a list")
-        
-        if not isinstance(self.config["filters"]["exclude_types"], list):
-            raise ConfigurationError("exclude_types must be a list")
-        
-        # Validate logging configuration
-        valid_log_levels = ["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"]
-        if self.config["logging"]["level"] not in valid_log_levels:
-            raise ConfigurationError(f"Log level must be one of: {', '.join(valid_log_levels)}")
+        dirty.clear()
     
     def get(self, key: str, default: Any = None) -> Any:
         """
@@ -181,17 +385,12 @@ class Configuration:
             default: Default value to return if key is not found
             
         Returns:
-            The configuration value or default if not found
+            The configuration value or default if not found; sections are
+            returned as copies, so editing them does not change the configuration
         """
-        keys = key.split('.')
-        value = self.config
-        
-        for k in keys:
-            if isinstance(value, dict) and k in value:
-                value = value[k]
-            else:
-                return default
-                
+        value = self._flat.get(key, default)
+        if isinstance(value, dict):
+            return copy.deepcopy(value)
         return value
     
     def set(self, key: str, value: Any) -> None:
@@ -202,24 +401,51 @@ class Configuration:
             key: The configuration key (can use dot notation for nested keys)
             value: The value to set
         """
-        keys = key.split('.')
-        config = self.config
+        keys = _split_key(key)
+        config = self._config
         
+        path = ""
         for k in keys[:-1]:
+            path = _join_key(path, k)
             if k not in config:
                 config[k] = {}
+                self._flat[path] = config[k]
+                self._dirty.add(path)
             config = config[k]
             
-        config[keys[-1]] = value
+        self._assign(config, keys[-1], _K(key), value)
+    
+    @property
+    def config(self) -> Dict[str, Any]:
+        """
+        The configuration values as a dictionary.
+        
+        This is a copy, so changes to it do not affect the configuration;
+        use set() or merge_config() so they are indexed and re-validated.
+        """
+        return self.as_dict()
     
     def as_dict(self) -> Dict[str, Any]:
         """
         Return the configuration as a dictionary.
         
         Returns:
-            A dictionary with all configuration values
+            A deep copy of all configuration values, independent of this object
+        """
+        return copy.deepcopy(self._config)
+    
+    @classmethod
+    def default_config(cls) -> Dict[str, Any]:
+        """
+        Return the default configuration values as a plain dictionary.
+        
+        Unlike DEFAULT_CONFIG, the result can be modified, deep-copied or
+        dumped to YAML freely.
+        
+        Returns:
+            A deep copy of the default configuration values
         """
-        return self.config.copy()
+        return copy.deepcopy(cls._DEFAULT_TEMPLATE)
     
     @classmethod
     def get_default_config_path(cls) -> Path:
@@ -231,27 +457,34 @@ class Configuration:
         """
         # Look for config in user's home directory
         home_config = Path.home() / ".pdfimages" / "config.yaml"
-        if home_config.exists():
+        if home_config.is_file():
             return home_config
             
-        # Look for config in current directory
+        # Look for config in current directory (only resolved if needed)
         local_config = Path.cwd() / "pdfimages.yaml"
-        if local_config.exists():
+        if local_config.is_file():
             return local_config
             
-        # Return the package default config path
-        return Path(__file__).parent.parent / "default_config.yaml"
+        # Fall back to the package default config path
+        return _PACKAGE_DEFAULT_CONFIG
     
     @classmethod
     def load_default(cls) -> 'Configuration':
         """
         Load the default configuration.
         
+        The packaged default_config.yaml only needs applying if it has been
+        edited to differ from the built-in defaults. Its parse is cached by
+        modification time and size, so repeated calls only cost a stat.
+        
         Returns:
             A Configuration object with default settings
         """
         try:
             default_path = cls.get_default_config_path()
+            if (default_path == _PACKAGE_DEFAULT_CONFIG
+                    and _cached_yaml_load(default_path) == cls._DEFAULT_TEMPLATE):
+                return cls()
             if default_path.exists():
                 return cls(config_file=default_path)
         except Exception:
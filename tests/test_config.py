@@ -1,7 +1,5 @@
 """Tests for the configuration management system."""
 
-import os
-import tempfile
 import yaml
 import pytest
 import copy
@@ -10,12 +8,18 @@ from pathlib import Path
 from pdfimages.utils.config import Configuration, ConfigurationError
 
 
+@pytest.fixture(scope="session")
+def _config_template():
+    """Fixture to build the default Configuration once per test session."""
+    return Configuration()
+
+
 @pytest.fixture(scope="function")
-def config():
+def config(_config_template):
     """Fixture to provide a fresh Configuration instance for each test."""
-    # Load configuration from the default config file
-    # This ensures tests use the same defaults as the application
-    return copy.deepcopy(Configuration())
+    # Each test gets its own deep copy of the shared template, so mutations
+    # made by one test never leak into another
+    return copy.deepcopy(_config_template)
 
 
 def test_default_configuration(config):
@@ -25,6 +29,15 @@ def test_default_configuration(config):
     assert config.get("logging.level") == "INFO"
 
 
+def test_builtin_defaults_match_default_config_file():
+    """Test that the built-in defaults match the packaged default_config.yaml."""
+    default_path = Path(__file__).parent.parent / "pdfimages" / "default_config.yaml"
+    with open(default_path) as f:
+        file_defaults = yaml.safe_load(f)
+    
+    assert Configuration().as_dict() == file_defaults
+
+
 def test_merge_with_dict(config):
     """Test merging configuration with a dictionary."""
     custom_config = {
@@ -50,10 +63,58 @@ def test_merge_with_dict(config):
     assert config.get("processing.deduplicate") is True
 
 
-def test_load_from_file(config):
-    """Test loading configuration from a YAML file."""
-    with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as temp:
-        yaml_content = """
+def test_defaults_not_shared_between_instances():
+    """Test that modifying one configuration does not leak into others."""
+    first = Configuration()
+    first.set("output.directory", "changed")
+    first.get("filters.include_types").append("extra")
+    
+    second = Configuration()
+    assert second.get("output.directory") == "extracted_images"
+    assert "extra" not in second.get("filters.include_types")
+
+
+def test_default_config_is_read_only():
+    """Test that the class-level defaults cannot be modified."""
+    with pytest.raises(TypeError):
+        Configuration.DEFAULT_CONFIG["output"]["directory"] = "changed"
+    
+    # Lists in the view are its own copies, so changing them cannot leak
+    Configuration.DEFAULT_CONFIG["filters"]["include_types"].append("leaked")
+    try:
+        assert Configuration().get("output.directory") == "extracted_images"
+        assert Configuration().get("filters.include_types") == ["images", "forms", "all"]
+    finally:
+        Configuration.DEFAULT_CONFIG["filters"]["include_types"].remove("leaked")
+
+
+def test_default_config_round_trips(config):
+    """Test that DEFAULT_CONFIG can be passed back into a Configuration."""
+    from_defaults = Configuration(Configuration.DEFAULT_CONFIG)
+    assert from_defaults.as_dict() == Configuration().as_dict()
+    assert from_defaults.get("filters.include_types") == Configuration.DEFAULT_CONFIG["filters"]["include_types"]
+    
+    config.set("output.directory", "changed")
+    config.merge_config(Configuration.DEFAULT_CONFIG)
+    config.validate()
+    assert config.get("output.directory") == "extracted_images"
+    assert isinstance(config.as_dict()["output"], dict)
+    
+    Configuration({"filters": dict(Configuration.DEFAULT_CONFIG["filters"])})
+
+
+def test_default_config_copy():
+    """Test that default_config() returns an independent plain dictionary."""
+    defaults = Configuration.default_config()
+    assert yaml.safe_load(yaml.safe_dump(defaults)) == defaults
+    
+    defaults["output"]["directory"] = "changed"
+    assert Configuration.default_config()["output"]["directory"] == "extracted_images"
+
+
+def test_load_from_string(config):
+    """Test loading configuration from a YAML string."""
+    yaml_content = """
 output:
   directory: file_output
   format: tiff
@@ -62,35 +123,52 @@ processing:
   min_height: 200
   quality: 90
 """
-        temp.write(yaml_content)
-        temp_path = temp.name
+    config.load_from_string(yaml_content)
     
-    try:
-        config.load_from_file(temp_path)
-        
-        # Check loaded values
-        assert config.get("output.directory") == "file_output"
-        assert config.get("output.format") == "tiff"
-        assert config.get("processing.min_width") == 200
-        assert config.get("processing.min_height") == 200
-        
-        # Check that other defaults are preserved
-        assert config.get("processing.quality") == 90
-    finally:
-        os.unlink(temp_path)
+    # Check loaded values
+    assert config.get("output.directory") == "file_output"
+    assert config.get("output.format") == "tiff"
+    assert config.get("processing.min_width") == 200
+    assert config.get("processing.min_height") == 200
+    
+    # Check that other defaults are preserved
+    assert config.get("processing.quality") == 90
+
+
+def test_invalid_yaml_string(config):
+    """Test handling of invalid YAML strings."""
+    with pytest.raises(ConfigurationError):
+        config.load_from_string("invalid: yaml: content:")
+
+
+def test_non_mapping_yaml_string(config):
+    """Test handling of YAML strings whose root is not a mapping."""
+    with pytest.raises(ConfigurationError):
+        config.load_from_string("hello")
+    with pytest.raises(ConfigurationError):
+        config.load_from_string("- a")
+
+
+def test_load_from_file_picks_up_changes(tmp_path):
+    """Test that reloading a file reflects edits and does not share state."""
+    config_path = tmp_path / "config.yaml"
+    config_path.write_text("output:\n  directory: first\n")
+    
+    first = Configuration(config_file=config_path)
+    first.set("output.directory", "mutated")
+    assert Configuration(config_file=config_path).get("output.directory") == "first"
+    
+    config_path.write_text("output:\n  directory: second_run\n")
+    assert Configuration(config_file=config_path).get("output.directory") == "second_run"
 
 
-def test_invalid_yaml_file():
+def test_invalid_yaml_file(tmp_path):
     """Test handling of invalid YAML files."""
-    with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as temp:
-        temp.write("invalid: yaml: content:")
-        temp_path = temp.name
+    config_path = tmp_path / "config.yaml"
+    config_path.write_text("invalid: yaml: content:")
     
-    try:
-        with pytest.raises(ConfigurationError):
-            Configuration(config_file=temp_path)
-    finally:
-        os.unlink(temp_path)
+    with pytest.raises(ConfigurationError):
+        Configuration(config_file=config_path)
 
 
 def test_nonexistent_file():
@@ -134,6 +212,36 @@ def test_validation_invalid_log_level(config):
         config.validate()
 
 
+def test_validation_non_string_log_level(config):
+    """Test validation of a log level that is not a string."""
+    with pytest.raises(ConfigurationError):
+        config.merge_config({"logging": {"level": ["INFO"]}})
+        config.validate()
+
+
+def test_validation_after_set(config):
+    """Test that values changed through set() are re-validated."""
+    config.set("processing.quality", 50)
+    config.validate()
+    
+    config.set("processing", {"quality": 50})
+    with pytest.raises(ConfigurationError):
+        config.validate()
+
+
+def test_invalid_keys_rejected(config):
+    """Test that keys which cannot be addressed with dot notation are rejected."""
+    with pytest.raises(ConfigurationError):
+        config.merge_config({"output.format": "bogus"})
+    with pytest.raises(ConfigurationError):
+        config.set("output", {"nested.key": 1})
+    with pytest.raises(ConfigurationError):
+        Configuration({1: "x"})
+    
+    assert config.get("output.format") == "png"
+    assert config.as_dict()["output"]["format"] == "png"
+
+
 def test_get_set_methods(config):
     """Test get and set methods for configuration values."""
     
@@ -152,6 +260,18 @@ def test_get_set_methods(config):
     assert config.get("new_section.nested.option") == 42
 
 
+def test_get_set_sections(config):
+    """Test that whole sections can be read and replaced by key."""
+    assert config.get("output")["directory"] == "extracted_images"
+    
+    config.set("output", {"directory": "replaced"})
+    assert config.get("output.directory") == "replaced"
+    assert config.get("output.format") is None
+    
+    config.merge_config({"output": {"format": "jpg"}})
+    assert config.get("output") == {"directory": "replaced", "format": "jpg"}
+
+
 def test_as_dict(config):
     """Test converting configuration to dictionary."""
     config_dict = config.as_dict()
@@ -162,22 +282,56 @@ def test_as_dict(config):
     assert config_dict["processing"]["quality"] == 90
 
 
-def test_get_default_config_path(monkeypatch):
+def test_returned_dicts_do_not_alias_configuration(config):
+    """Test that editing returned dictionaries does not change the configuration."""
+    config.as_dict()["processing"]["quality"] = 500
+    assert config.get("processing.quality") == 90
+    config.validate()
+    
+    config.get("output")["format"] = "jpg"
+    assert config.get("output.format") == "png"
+    
+    config.config["output"]["format"] = "jpg"
+    assert config.config["output"]["format"] == "png"
+    
+    section = {"format": "tiff"}
+    config.set("output", section)
+    section["format"] = "bmp"
+    assert config.get("output.format") == "tiff"
+
+
+def test_get_default_config_path(monkeypatch, tmp_path):
     """Test getting the default configuration path."""
     # Mock home directory
-    mock_home = tempfile.mkdtemp()
-    monkeypatch.setattr(Path, "home", lambda: Path(mock_home))
+    monkeypatch.setattr(Path, "home", lambda: tmp_path)
     
     # Test when no config files exist
     config_path = Configuration.get_default_config_path()
     assert "default_config.yaml" in str(config_path)
     
     # Create a config in the home directory
-    os.makedirs(os.path.join(mock_home, ".pdfimages"), exist_ok=True)
-    home_config = os.path.join(mock_home, ".pdfimages", "config.yaml")
-    with open(home_config, 'w') as f:
-        f.write("# Home config")
+    (tmp_path / ".pdfimages").mkdir()
+    home_config = tmp_path / ".pdfimages" / "config.yaml"
+    home_config.write_text("# Home config")
     
     # Test that home config is found
     config_path = Configuration.get_default_config_path()
-    assert config_path == Path(home_config)
+    assert config_path == home_config
+
+
+def test_load_default_applies_edited_package_defaults(monkeypatch, tmp_path):
+    """Test that edits to the packaged default config are picked up."""
+    import pdfimages.utils.config as config_module
+    
+    monkeypatch.setattr(Path, "home", lambda: tmp_path)
+    monkeypatch.chdir(tmp_path)
+    
+    package_default = tmp_path / "default_config.yaml"
+    package_default.write_text(yaml.safe_dump(Configuration.default_config()))
+    monkeypatch.setattr(config_module, "_PACKAGE_DEFAULT_CONFIG", package_default)
+    assert Configuration.load_default().get("output.format") == "png"
+    
+    edited = Configuration.default_config()
+    edited["output"]["format"] = "tiff"
+    package_default.write_text(yaml.safe_dump(edited))
+    assert Configuration.load_default().get("output.format") == "tiff"